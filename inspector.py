@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 import logging
 from pathlib import Path
@@ -9,89 +10,110 @@ logger = logging.getLogger(__name__)
 class AccessInspector:
     def __init__(self, parsed_dfs):
         """Initialize with dictionary of parsed dataframes"""
-        self.dfs = parsed_dfs
+        self.dfs = self._normalize_dates(parsed_dfs)
+        self.now = pd.Timestamp.now()
         self.current_fy_start = self._get_current_fy_start()
+        self.email_cols = {
+            'okta': 'user.email',
+            'slack': 'Email',
+            'gws': 'Email Address [Required]'
+        }
+        
+        # Flag joiners, leavers and active employees once for all checks
+        df_darwinbox = self.dfs['darwinbox']
+        self.hr_columns = list(df_darwinbox.columns)
+        self.dfs['darwinbox'] = df_darwinbox.assign(
+            is_new_joiner=df_darwinbox['Date Of Joining'] >= self.current_fy_start,
+            is_leaver=(df_darwinbox['Date Of Exit'] >= self.current_fy_start) & df_darwinbox['Date Of Exit'].notna(),
+            _active=df_darwinbox['Date Of Exit'].isna()
+        )
+        self.hr_emails = frozenset(self.dfs['darwinbox']['Official Email ID'].dropna())
+        
+        # Index only the system columns the checks look up, first record per email
+        lookup_cols = {
+            'okta': ['user.created', 'user.lastLogin', 'user.status'],
+            'slack': ['Account created (UTC)', 'Last active (UTC)', 'Deactivated date (UTC)'],
+            'gws': ['Last Sign In [READ ONLY]', 'Status [READ ONLY]']
+        }
+        self.by_email = {
+            system: self.dfs[system][[email_col] + lookup_cols[system]]
+                .dropna(subset=[email_col]).drop_duplicates(email_col).set_index(email_col)
+            for system, email_col in self.email_cols.items()
+        }
+        self._cache = {}
         
     def _get_current_fy_start(self):
         """Get the start date of current financial year (April-March)."""
-        today = datetime.now()
+        today = self.now
         if today.month < 4:
             return datetime(today.year - 1, 4, 1)
         return datetime(today.year, 4, 1)
 
-    def _convert_to_datetime(self, date_str):
-        """Convert string date to datetime for comparison."""
-        if pd.isna(date_str) or date_str == '':
-            return None
-        try:
-            if isinstance(date_str, str):
-                return pd.to_datetime(date_str, format='%d-%m-%Y')
-            return date_str
-        except:
-            return None
+    def _normalize_dates(self, parsed_dfs):
+        """Return the parsed dataframes with their date columns converted to datetime."""
+        date_cols = {
+            'darwinbox': ['Date Of Joining', 'Date Of Exit'],
+            'okta': ['user.created', 'user.lastLogin'],
+            'slack': ['Account created (UTC)', 'Last active (UTC)', 'Deactivated date (UTC)'],
+            'gws': ['Last Sign In [READ ONLY]']
+        }
+        dfs = dict(parsed_dfs)
+        for name, cols in date_cols.items():
+            if name in dfs:
+                df = dfs[name]
+                dfs[name] = df.assign(**{
+                    col: pd.to_datetime(df[col], format='%d-%m-%Y', errors='coerce')
+                    for col in cols if col in df.columns
+                })
+        return dfs
+
+    def _format_dates(self, dates):
+        """Format a datetime series as dd-mm-yyyy strings, leaving missing dates empty."""
+        return dates.dt.strftime('%d-%m-%Y').where(dates.notna(), None)
 
-    def _format_date(self, date):
-        """Format datetime to dd-mm-yyyy string."""
-        if pd.isna(date) or date is None:
-            return None
-        if isinstance(date, str):
-            return date
-        return date.strftime('%d-%m-%Y')
+    def _system_lookup(self, system, columns, emails):
+        """Look up system columns for each email, aligned to the index of the emails series."""
+        records = self.by_email[system].reindex(emails.values)[list(columns)]
+        records.index = emails.index
+        return records.rename(columns=columns)
 
     def joiner_checks(self):
         """Perform new joiner compliance checks."""
         try:
-            df_darwinbox = self.dfs['darwinbox'].copy()
-            df_okta = self.dfs['okta']
-            df_slack = self.dfs['slack']
-            df_gws = self.dfs['gws']
+            if 'joiner_checks' in self._cache:
+                return self._cache['joiner_checks']
+            
+            df_darwinbox = self.dfs['darwinbox']
             
             # Filter new joiners in current FY
-            df_darwinbox['Date Of Joining'] = df_darwinbox['Date Of Joining'].apply(self._convert_to_datetime)
-            df_darwinbox['is_new_joiner'] = df_darwinbox['Date Of Joining'] >= self.current_fy_start
-            
-            # Add compliance and system access columns
-            df_darwinbox['compliance_status'] = 'Compliant'
-            df_darwinbox['action_item'] = 'No Action Required'
-            df_darwinbox['okta_created_date'] = None
-            df_darwinbox['slack_created_date'] = None
-            df_darwinbox['gws_created_date'] = None
-            
-            for idx, row in df_darwinbox[df_darwinbox['is_new_joiner']].iterrows():
-                email = row['Official Email ID']
-                joining_date = row['Date Of Joining']
-                
-                # Check access dates in each system
-                okta_record = df_okta[df_okta['user.email'] == email]
-                if not okta_record.empty:
-                    df_darwinbox.at[idx, 'okta_created_date'] = okta_record['user.created'].iloc[0]
-                    
-                slack_record = df_slack[df_slack['Email'] == email]
-                if not slack_record.empty:
-                    df_darwinbox.at[idx, 'slack_created_date'] = slack_record['Account created (UTC)'].iloc[0]
-                    
-                gws_record = df_gws[df_gws['Email Address [Required]'] == email]
-                if not gws_record.empty:
-                    df_darwinbox.at[idx, 'gws_created_date'] = gws_record['Last Sign In [READ ONLY]'].iloc[0]
-                
-                # Check compliance based on access dates
-                for system, date_col in [
-                    ('Okta', 'okta_created_date'),
-                    ('Slack', 'slack_created_date'),
-                    ('GWS', 'gws_created_date')
-                ]:
-                    if pd.notna(df_darwinbox.at[idx, date_col]):
-                        access_date = pd.to_datetime(df_darwinbox.at[idx, date_col], format='%d-%m-%Y')
-                        if access_date < (joining_date - timedelta(hours=24)):
-                            df_darwinbox.at[idx, 'compliance_status'] = 'Non Compliant'
-                            df_darwinbox.at[idx, 'action_item'] = 'Investigate'
+            joiners = df_darwinbox.loc[df_darwinbox['is_new_joiner'], self.hr_columns + ['is_new_joiner']]
+            
+            # Attach access dates from each system
+            emails = joiners['Official Email ID']
+            date_cols = ['okta_created_date', 'slack_created_date', 'gws_created_date']
+            df = pd.concat([
+                joiners,
+                self._system_lookup('okta', {'user.created': 'okta_created_date'}, emails),
+                self._system_lookup('slack', {'Account created (UTC)': 'slack_created_date'}, emails),
+                self._system_lookup('gws', {'Last Sign In [READ ONLY]': 'gws_created_date'}, emails)
+            ], axis=1)
+            
+            # Access granted more than 24 hours before joining is non compliant
+            threshold = df['Date Of Joining'] - timedelta(hours=24)
+            non_compliant = (
+                (df['okta_created_date'] < threshold) |
+                (df['slack_created_date'] < threshold) |
+                (df['gws_created_date'] < threshold)
+            ).fillna(False)
+            df['compliance_status'] = np.where(non_compliant, 'Non Compliant', 'Compliant')
+            df['action_item'] = np.where(non_compliant, 'Investigate', 'No Action Required')
             
             # Before returning, convert dates back to string format
-            for col in ['Date Of Joining', 'okta_created_date', 'slack_created_date', 'gws_created_date']:
-                if col in df_darwinbox.columns:
-                    df_darwinbox[col] = df_darwinbox[col].apply(self._format_date)
+            for col in ['Date Of Joining', 'Date Of Exit'] + date_cols:
+                df[col] = self._format_dates(df[col])
             
-            return df_darwinbox[df_darwinbox['is_new_joiner']]
+            self._cache['joiner_checks'] = df[list(joiners.columns) + ['compliance_status', 'action_item'] + date_cols]
+            return self._cache['joiner_checks']
             
         except Exception as e:
             logger.error(f"Error in joiner checks: {str(e)}")
@@ -102,68 +124,51 @@ class AccessInspector:
     def leaver_checks(self):
         """Perform leaver compliance checks."""
         try:
-            df_darwinbox = self.dfs['darwinbox'].copy()
-            df_okta = self.dfs['okta']
-            df_slack = self.dfs['slack']
-            df_gws = self.dfs['gws']
+            if 'leaver_checks' in self._cache:
+                return self._cache['leaver_checks']
+            
+            df_darwinbox = self.dfs['darwinbox']
             
             # Filter leavers in current FY
-            df_darwinbox['Date Of Exit'] = df_darwinbox['Date Of Exit'].apply(self._convert_to_datetime)
-            df_darwinbox['is_leaver'] = (df_darwinbox['Date Of Exit'] >= self.current_fy_start) & \
-                                      (df_darwinbox['Date Of Exit'].notna())
-            
-            # Add compliance and system access columns
-            df_darwinbox['compliance_status'] = 'Compliant'
-            df_darwinbox['action_item'] = 'No Action Required'
-            df_darwinbox['okta_last_login'] = None
-            df_darwinbox['slack_last_login'] = None
-            df_darwinbox['gws_last_login'] = None
-            df_darwinbox['okta_status'] = None
-            df_darwinbox['slack_status'] = None
-            df_darwinbox['gws_status'] = None
-            
-            for idx, row in df_darwinbox[df_darwinbox['is_leaver']].iterrows():
-                email = row['Official Email ID']
-                exit_date = row['Date Of Exit']
-                
-                # Get system access details
-                okta_record = df_okta[df_okta['user.email'] == email]
-                if not okta_record.empty:
-                    df_darwinbox.at[idx, 'okta_last_login'] = okta_record['user.lastLogin'].iloc[0]
-                    df_darwinbox.at[idx, 'okta_status'] = okta_record['user.status'].iloc[0]
-                    
-                slack_record = df_slack[df_slack['Email'] == email]
-                if not slack_record.empty:
-                    df_darwinbox.at[idx, 'slack_last_login'] = slack_record['Last active (UTC)'].iloc[0]
-                    df_darwinbox.at[idx, 'slack_status'] = 'Deactivated' if pd.notna(slack_record['Deactivated date (UTC)'].iloc[0]) else 'Active'
-                    
-                gws_record = df_gws[df_gws['Email Address [Required]'] == email]
-                if not gws_record.empty:
-                    df_darwinbox.at[idx, 'gws_last_login'] = gws_record['Last Sign In [READ ONLY]'].iloc[0]
-                    df_darwinbox.at[idx, 'gws_status'] = gws_record['Status [READ ONLY]'].iloc[0]
-                
-                # Check compliance based on access status and last login
-                for system in ['okta', 'slack', 'gws']:
-                    status_col = f'{system}_status'
-                    login_col = f'{system}_last_login'
-                    
-                    if pd.notna(df_darwinbox.at[idx, status_col]) and df_darwinbox.at[idx, status_col] == 'ACTIVE':
-                        if datetime.now() > (exit_date + timedelta(hours=24)):
-                            df_darwinbox.at[idx, 'compliance_status'] = 'Non Compliant'
-                            df_darwinbox.at[idx, 'action_item'] = 'Investigate'
-                    
-                    if pd.notna(df_darwinbox.at[idx, login_col]):
-                        last_login = pd.to_datetime(df_darwinbox.at[idx, login_col], format='%d-%m-%Y')
-                        if last_login > exit_date:
-                            df_darwinbox.at[idx, 'compliance_status'] = 'Non Compliant'
-                            df_darwinbox.at[idx, 'action_item'] = 'Revoke'
+            leavers = df_darwinbox.loc[df_darwinbox['is_leaver'], self.hr_columns + ['is_leaver']]
+            
+            # Attach last login and status from each system
+            emails = leavers['Official Email ID']
+            slack = self._system_lookup('slack', {
+                'Last active (UTC)': 'slack_last_login',
+                'Deactivated date (UTC)': 'slack_deactivated_date'
+            }, emails)
+            slack['slack_status'] = np.select(
+                [~emails.isin(self.by_email['slack'].index), slack['slack_deactivated_date'].notna()],
+                [None, 'Deactivated'],
+                default='Active'
+            )
+            login_cols = ['okta_last_login', 'slack_last_login', 'gws_last_login']
+            status_cols = ['okta_status', 'slack_status', 'gws_status']
+            df = pd.concat([
+                leavers,
+                self._system_lookup('okta', {'user.lastLogin': 'okta_last_login', 'user.status': 'okta_status'}, emails),
+                slack.drop(columns='slack_deactivated_date'),
+                self._system_lookup('gws', {'Last Sign In [READ ONLY]': 'gws_last_login', 'Status [READ ONLY]': 'gws_status'}, emails)
+            ], axis=1)
+            
+            # Access still active 24 hours after exit, or any login after exit, is non compliant
+            active_after_exit = ((df['okta_status'] == 'ACTIVE') | (df['gws_status'] == 'ACTIVE')) & \
+                                (self.now > df['Date Of Exit'] + timedelta(hours=24))
+            login_after_exit = df[login_cols].max(axis=1) > df['Date Of Exit']
+            df['action_item'] = np.select(
+                [login_after_exit, active_after_exit],
+                ['Revoke', 'Investigate'],
+                default='No Action Required'
+            )
+            df['compliance_status'] = np.where(df['action_item'] == 'No Action Required', 'Compliant', 'Non Compliant')
             
             # Before returning, convert dates back to string format
-            for col in ['Date Of Exit', 'okta_last_login', 'slack_last_login', 'gws_last_login']:
-                if col in df_darwinbox.columns:
-                    df_darwinbox[col] = df_darwinbox[col].apply(self._format_date)
+            for col in ['Date Of Joining', 'Date Of Exit'] + login_cols:
+                df[col] = self._format_dates(df[col])
             
-            return df_darwinbox[df_darwinbox['is_leaver']]
+            self._cache['leaver_checks'] = df[list(leavers.columns) + ['compliance_status', 'action_item'] + login_cols + status_cols]
+            return self._cache['leaver_checks']
             
         except Exception as e:
             logger.error(f"Error in leaver checks: {str(e)}")
@@ -172,55 +177,66 @@ class AccessInspector:
     def idle_checks(self):
         """Perform idle user checks."""
         try:
-            df_darwinbox = self.dfs['darwinbox'].copy()
-            df_okta = self.dfs['okta']
-            df_slack = self.dfs['slack']
-            df_gws = self.dfs['gws']
+            if 'idle_checks' in self._cache:
+                return self._cache['idle_checks']
+            
+            df_darwinbox = self.dfs['darwinbox']
             
             # Filter active users
-            active_users = df_darwinbox[df_darwinbox['Date Of Exit'].isna()].copy()
-            
-            # Add idle check columns
-            for days in [45, 90, 120]:
-                active_users[f'idle_{days}_days'] = False
-            active_users['action_item'] = 'No Action Required'
-            
-            # Add system-specific columns
-            active_users['idle_systems'] = ''
-            active_users['okta_last_login'] = None
-            active_users['slack_last_login'] = None
-            active_users['gws_last_login'] = None
-            
-            for idx, row in active_users.iterrows():
-                email = row['Official Email ID']
-                idle_systems = []
-                
-                for system, df, login_col, email_col in [
-                    ('Okta', df_okta, 'user.lastLogin', 'user.email'),
-                    ('Slack', df_slack, 'Last active (UTC)', 'Email'),
-                    ('GWS', df_gws, 'Last Sign In [READ ONLY]', 'Email Address [Required]')
-                ]:
-                    user_record = df[df[email_col] == email]
-                    if not user_record.empty:
-                        last_login = pd.to_datetime(user_record[login_col].iloc[0], format='%d-%m-%Y')
-                        # Store last login date for each system
-                        active_users.at[idx, f'{system.lower()}_last_login'] = self._format_date(last_login)
-                        
-                        days_idle = (datetime.now() - last_login).days
-                        
-                        for threshold in [45, 90, 120]:
-                            if days_idle >= threshold:
-                                active_users.at[idx, f'idle_{threshold}_days'] = True
-                                if system not in idle_systems:
-                                    idle_systems.append(system)
-                                if threshold >= 120:
-                                    active_users.at[idx, 'action_item'] = 'Disable'
-                                elif threshold >= 90 and active_users.at[idx, 'action_item'] != 'Disable':
-                                    active_users.at[idx, 'action_item'] = 'Investigate'
-                
-                active_users.at[idx, 'idle_systems'] = ', '.join(idle_systems) if idle_systems else 'None'
+            active_users = df_darwinbox.loc[df_darwinbox['_active'], self.hr_columns]
+            
+            # Attach last login from each system
+            emails = active_users['Official Email ID']
+            df = pd.concat([
+                active_users,
+                self._system_lookup('okta', {'user.lastLogin': 'okta_last_login'}, emails),
+                self._system_lookup('slack', {'Last active (UTC)': 'slack_last_login'}, emails),
+                self._system_lookup('gws', {'Last Sign In [READ ONLY]': 'gws_last_login'}, emails)
+            ], axis=1)
+            
+            # Days since last login per system
+            days_idle = {}
+            for system in ['Okta', 'Slack', 'GWS']:
+                days_idle[system] = (self.now - df[f'{system.lower()}_last_login']).dt.days
+            
+            # Classify on the longest idle period across systems, ignoring missing logins
+            max_days_idle = np.fmax.reduce([
+                days.to_numpy(dtype=float, na_value=np.nan) for days in days_idle.values()
+            ])
+            for threshold in [45, 90, 120]:
+                df[f'idle_{threshold}_days'] = max_days_idle >= threshold
+            df['action_item'] = np.select(
+                [max_days_idle >= 120, max_days_idle >= 90],
+                ['Disable', 'Investigate'],
+                default='No Action Required'
+            )
+            
+            # Flag the systems each user is idle in
+            systems = ['Okta', 'Slack', 'GWS']
+            system_idle_cols = [f'{system.lower()}_idle' for system in systems]
+            for system, col in zip(systems, system_idle_cols):
+                df[col] = days_idle[system] >= 45
+            
+            # List the idle systems: encode the flags as bits and look the label
+            # up from the 8 possible combinations
+            idle_code = sum(
+                df[col].to_numpy(dtype=np.int8) << bit
+                for bit, col in enumerate(system_idle_cols)
+            )
+            labels = np.array([
+                ', '.join(system for bit, system in enumerate(systems) if code >> bit & 1) or 'None'
+                for code in range(2 ** len(systems))
+            ], dtype=object)
+            df['idle_systems'] = labels[idle_code]
+            
+            # Before returning, convert dates back to string format
+            login_cols = ['okta_last_login', 'slack_last_login', 'gws_last_login']
+            for col in ['Date Of Joining', 'Date Of Exit'] + login_cols:
+                df[col] = self._format_dates(df[col])
             
-            return active_users
+            idle_cols = ['idle_45_days', 'idle_90_days', 'idle_120_days', 'action_item', 'idle_systems'] + system_idle_cols
+            self._cache['idle_checks'] = df[list(active_users.columns) + idle_cols + login_cols]
+            return self._cache['idle_checks']
             
         except Exception as e:
             logger.error(f"Error in idle checks: {str(e)}")
@@ -229,86 +245,70 @@ class AccessInspector:
     def system_user_checks(self):
         """Perform system user checks."""
         try:
-            df_darwinbox = self.dfs['darwinbox']
-            df_okta = self.dfs['okta'].copy()
-            df_slack = self.dfs['slack'].copy()
-            df_gws = self.dfs['gws'].copy()
-            
-            hr_emails = set(df_darwinbox['Official Email ID'])
-            
-            def is_human_email(email):
-                """Check if email follows firstname.lastname@domain format."""
-                try:
-                    local_part = email.split('@')[0]
-                    parts = local_part.split('.')
-                    return len(parts) == 2 and all(part.isalpha() for part in parts)
-                except:
-                    return False
+            if 'system_user_checks' in self._cache:
+                return self._cache['system_user_checks']
             
             system_users = []
             for system, df, email_col, login_col, status_col in [
-                ('Okta', df_okta, 'user.email', 'user.lastLogin', 'user.status'),
-                ('Slack', df_slack, 'Email', 'Last active (UTC)', 'Deactivated date (UTC)'),
-                ('GWS', df_gws, 'Email Address [Required]', 'Last Sign In [READ ONLY]', 'Status [READ ONLY]')
+                ('Okta', self.dfs['okta'], 'user.email', 'user.lastLogin', 'user.status'),
+                ('Slack', self.dfs['slack'], 'Email', 'Last active (UTC)', 'Deactivated date (UTC)'),
+                ('GWS', self.dfs['gws'], 'Email Address [Required]', 'Last Sign In [READ ONLY]', 'Status [READ ONLY]')
             ]:
                 # For Okta, filter out deprovisioned/suspended users
                 if system == 'Okta':
                     df = df[~df[status_col].isin(['DEPROVISIONED', 'SUSPENDED'])]
                 
-                system_emails = set(df[email_col]) - hr_emails
-                for email in system_emails:
-                    user_record = df[df[email_col] == email].iloc[0]
-                    is_human = is_human_email(email)
-                    
-                    # Get status based on system
-                    if system == 'Slack':
-                        status = 'Deactivated' if pd.notna(user_record[status_col]) else 'Active'
-                        if status == 'Deactivated':
-                            continue
-                    else:
-                        status = user_record[status_col] if pd.notna(user_record[status_col]) else 'Unknown'
-                    
-                    system_users.append({
-                        'Email': email,
-                        'Source System': system,
-                        'is_human_user?': is_human,
-                        'Last Login': self._format_date(pd.to_datetime(user_record[login_col], format='%d-%m-%Y')),
-                        'Status': status,
-                        'tracked_in_darwinbox': False,
-                        'Action Item': 'Investigate' if is_human else 'No Action Required'
-                    })
-            
-            return pd.DataFrame(system_users)
+                # Users not tracked in HR, first record per email
+                df = df[df[email_col].notna() & ~df[email_col].isin(self.hr_emails)].drop_duplicates(email_col)
+                
+                # Get status based on system
+                if system == 'Slack':
+                    df = df[df[status_col].isna()]
+                    status = 'Active'
+                else:
+                    status = df[status_col].fillna('Unknown')
+                
+                # Human users follow the firstname.lastname@domain format
+                is_human = df[email_col].str.match(r'^[^\W\d_]+\.[^\W\d_]+(?:@|$)', na=False).astype(bool)
+                
+                system_users.append(pd.DataFrame({
+                    'Email': df[email_col],
+                    'Source System': system,
+                    'is_human_user?': is_human,
+                    'Last Login': df[login_col],
+                    'Status': status,
+                    'tracked_in_darwinbox': False,
+                    'Action Item': np.where(is_human, 'Investigate', 'No Action Required')
+                }))
+            
+            system_users = pd.concat(system_users, ignore_index=True)
+            system_users['Last Login'] = self._format_dates(system_users['Last Login'])
+            
+            self._cache['system_user_checks'] = system_users
+            return self._cache['system_user_checks']
             
         except Exception as e:
             logger.error(f"Error in system user checks: {str(e)}")
             raise
 
+    def _compliance_rate(self, results):
+        """Return total checked, non compliant count and compliance rate for a check result."""
+        counts = results['compliance_status'].value_counts()
+        total = int(counts.sum())
+        non_compliant = int(counts.get('Non Compliant', 0))
+        rate = f"{((total - non_compliant) / total * 100):.1f}%" if total > 0 else "N/A"
+        return total, non_compliant, rate
+
     def generate_summaries(self):
         """Generate all summary data needed for the report."""
         try:
             # HR Summary
             df_darwinbox = self.dfs['darwinbox']
-            
-            # First ensure Date Of Joining is in datetime format
-            df_darwinbox['Date Of Joining'] = pd.to_datetime(
-                df_darwinbox['Date Of Joining'], 
-                format='%d-%m-%Y',  # Specify the format explicitly
-                errors='coerce'
-            )
-            
-            # Calculate new joiners based on current FY
-            df_darwinbox['is_new_joiner'] = df_darwinbox['Date Of Joining'] >= self.current_fy_start
-            
-            hr_summary = []
-            for emp_type in df_darwinbox['Employee Type'].unique():
-                type_df = df_darwinbox[df_darwinbox['Employee Type'] == emp_type]
-                hr_summary.append({
-                    'Employee Type': emp_type,
-                    'New Joiners': len(type_df[type_df['is_new_joiner']]),
-                    'Active Employees': len(type_df[type_df['Date Of Exit'].isna()]),
-                    'Terminated Users': len(type_df[type_df['Date Of Exit'].notna()])
-                })
+            hr_summary = df_darwinbox.groupby('Employee Type', sort=False, dropna=False).agg(**{
+                'New Joiners': ('is_new_joiner', 'sum'),
+                'Active Employees': ('_active', 'sum'),
+                'Terminated Users': ('Date Of Exit', 'count')
+            }).reset_index()
             
             # IT Systems Summary
             it_summary = []
@@ -335,27 +335,18 @@ class AccessInspector:
             # Compliance Summary
             compliance_summary = []
             
-            # Joiner compliance
-            joiner_results = self.joiner_checks()
-            non_compliant = len(joiner_results[joiner_results['compliance_status'] == 'Non Compliant'])
-            total = len(joiner_results)
-            compliance_summary.append({
-                'Check Type': 'New Joiner Access',
-                'Total Checked': total,
-                'Non Compliant': non_compliant,
-                'Compliance Rate': f"{((total - non_compliant) / total * 100):.1f}%" if total > 0 else "N/A"
-            })
-            
-            # Leaver compliance
-            leaver_results = self.leaver_checks()
-            non_compliant = len(leaver_results[leaver_results['compliance_status'] == 'Non Compliant'])
-            total = len(leaver_results)
-            compliance_summary.append({
-                'Check Type': 'Leaver Access',
-                'Total Checked': total,
-                'Non Compliant': non_compliant,
-                'Compliance Rate': f"{((total - non_compliant) / total * 100):.1f}%" if total > 0 else "N/A"
-            })
+            # Joiner and leaver compliance
+            for check_type, results in [
+                ('New Joiner Access', self.joiner_checks()),
+                ('Leaver Access', self.leaver_checks())
+            ]:
+                total, non_compliant, rate = self._compliance_rate(results)
+                compliance_summary.append({
+                    'Check Type': check_type,
+                    'Total Checked': total,
+                    'Non Compliant': non_compliant,
+                    'Compliance Rate': rate
+                })
             
             # Idle user compliance with system breakdown
             idle_results = self.idle_checks()
@@ -372,8 +363,7 @@ class AccessInspector:
 
             # Count idle users per system
             for system in ['Okta', 'Slack', 'GWS']:
-                system_idle = idle_results[idle_results['idle_systems'].str.contains(system, case=False, na=False)]
-                idle_summary[system] = len(system_idle)
+                idle_summary[system] = int(idle_results[f'{system.lower()}_idle'].sum())
 
             # Count total idle users per threshold
             for threshold in [45, 90, 120]:
@@ -401,7 +391,7 @@ class AccessInspector:
             compliance_summary.append(system_summary)
 
             return {
-                'hr_summary': pd.DataFrame(hr_summary),
+                'hr_summary': hr_summary,
                 'it_summary': pd.DataFrame(it_summary),
                 'compliance_summary': pd.DataFrame(compliance_summary)
             }
@@ -1,129 +1,220 @@
 import pandas as pd
 from datetime import datetime
 import openpyxl
+import importlib.util
 import logging
+import os
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import dateparser
 from dateutil import parser as date_parser
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class DataParser:
-    def __init__(self, data_folder):
-        self.data_folder = Path(data_folder)
-        self.parsed_dates = {}
+# Known date formats, tried in order
+DATE_FORMATS = [
+    # ISO formats
+    '%Y-%m-%d',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S.%fZ',
+    
+    # Common formats
+    '%d-%m-%Y',
+    '%d/%m/%Y',
+    '%m/%d/%Y',
+    
+    # With time
+    '%d-%m-%Y %H:%M:%S',
+    '%d/%m/%Y %H:%M:%S',
+    '%m/%d/%Y %H:%M:%S',
+    
+    # GWS format
+    '%Y/%m/%d %H:%M:%S'
+]
+
+# Use the Rust-backed calamine reader when installed (pandas 2.2+), otherwise the default engine
+_PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+EXCEL_ENGINE = 'calamine' if _PANDAS_VERSION >= (2, 2) and importlib.util.find_spec('python_calamine') else None
+
+# Total input size from which sheets are parsed in worker processes (needs more than one CPU)
+PARALLEL_MIN_BYTES = 100 * 1024 * 1024
+
+# Values that mean "no date", compared lower-cased
+_EMPTY = frozenset({'', 'nan', 'nat', 'none', 'never logged in', 'n/a', 'na'})
+
+@lru_cache(maxsize=1_000_000)
+def _parse_date_cached(date_str, month_start, formats_tried=False):
+    """Parse a date string to dd-mm-yyyy, falling back to dateutil; cached across instances.
+    
+    month_start fills in missing date parts and is part of the cache key, so
+    cached results do not go stale when the month changes. formats_tried skips
+    the strptime formats when the caller has already tried them all.
+    """
+    # Handle empty values and "Never logged in"
+    if date_str.lower() in _EMPTY:
+        return None
         
-    def parse_date(self, date_str):
-        """Parse different date formats to dd-mm-yyyy using dateparser."""
-        # Handle empty values and "Never logged in"
-        if pd.isna(date_str) or str(date_str).strip() == '' or str(date_str).strip().lower() == 'never logged in':
-            return None
-            
-        try:
-            # Step 1: Clean and standardize input
-            if isinstance(date_str, datetime):
-                return date_str.strftime('%d-%m-%Y')
-            
-            date_str = str(date_str).strip()
-            
-            # New Step: Handle Excel timestamp numbers
+    try:
+        # Step 1: Handle GWS format specifically (YYYY/MM/DD HH:MM:SS)
+        if '/' in date_str and ':' in date_str:
             try:
-                if date_str.replace('.', '').isdigit():
-                    # Convert to float and check if it looks like an Excel timestamp
-                    timestamp = float(date_str)
-                    if timestamp > 25569:  # Excel timestamps start from 1900-01-01
-                        # Convert Excel timestamp to datetime
-                        delta = pd.Timedelta(days=timestamp-25569)
-                        base_date = pd.Timestamp('1900-01-01')
-                        parsed_date = base_date + delta
-                        return parsed_date.strftime('%d-%m-%Y')
+                # Replace '/' with '-' for consistent parsing; the rewritten
+                # string is new to the caller, so its formats are tried again
+                date_str = date_str.replace('/', '-')
+                formats_tried = False
+                parsed_date = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
+                return parsed_date.strftime('%d-%m-%Y')
             except:
                 pass
-            
-            # Step 2: Handle GWS format specifically (YYYY/MM/DD HH:MM:SS)
-            if '/' in date_str and ':' in date_str:
-                try:
-                    # Replace '/' with '-' for consistent parsing
-                    date_str = date_str.replace('/', '-')
-                    parsed_date = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-                    return parsed_date.strftime('%d-%m-%Y')
-                except:
-                    pass
-            
-            # Step 3: Try common specific formats
-            specific_formats = [
-                # ISO formats
-                '%Y-%m-%d',
-                '%Y-%m-%d %H:%M:%S',
-                '%Y-%m-%dT%H:%M:%S',
-                '%Y-%m-%dT%H:%M:%S.%fZ',
-                
-                # Common formats
-                '%d-%m-%Y',
-                '%d/%m/%Y',
-                '%m/%d/%Y',
-                
-                # With time
-                '%d-%m-%Y %H:%M:%S',
-                '%d/%m/%Y %H:%M:%S',
-                '%m/%d/%Y %H:%M:%S',
-                
-                # GWS format
-                '%Y/%m/%d %H:%M:%S'
-            ]
-            
-            for fmt in specific_formats:
+        
+        # Step 2: Try common specific formats
+        if not formats_tried:
+            for fmt in DATE_FORMATS:
                 try:
                     parsed_date = datetime.strptime(date_str, fmt)
                     return parsed_date.strftime('%d-%m-%Y')
                 except ValueError:
                     continue
-            
-            # Step 4: Handle GWS AM/PM format
-            if 'AM' in date_str.upper() or 'PM' in date_str.upper():
-                try:
-                    parsed_date = date_parser.parse(date_str)
-                    return parsed_date.strftime('%d-%m-%Y')
-                except:
-                    pass
-            
-            # Step 5: Handle Unix timestamps
-            if date_str.replace('.', '').isdigit():
-                try:
-                    # Handle milliseconds
-                    if len(date_str) > 10:
-                        timestamp = float(date_str) / 1000
-                    else:
-                        timestamp = float(date_str)
-                    return datetime.fromtimestamp(timestamp).strftime('%d-%m-%Y')
-                except:
-                    pass
-            
-            # Step 6: Use dateparser as final fallback
+        
+        # Step 3: Handle GWS AM/PM format
+        if 'AM' in date_str.upper() or 'PM' in date_str.upper():
             try:
-                parsed_date = dateparser.parse(
-                    date_str,
-                    settings={
-                        'DATE_ORDER': 'DMY',
-                        'STRICT_PARSING': False,
-                        'PREFER_DAY_OF_MONTH': 'first',
-                        'RETURN_AS_TIMEZONE_AWARE': False
-                    }
-                )
-                if parsed_date:
-                    return parsed_date.strftime('%d-%m-%Y')
+                parsed_date = date_parser.parse(date_str)
+                return parsed_date.strftime('%d-%m-%Y')
             except:
                 pass
-            
-            # Step 7: Log unparseable dates (except "Never logged in")
-            if date_str.lower() != 'never logged in':
-                logger.warning(f"Could not parse date: {date_str}")
+        
+        # Step 4: Use dateutil as final fallback (day first, missing day -> 1st)
+        try:
+            parsed_date = date_parser.parse(date_str, dayfirst=True, default=month_start)
+            return parsed_date.strftime('%d-%m-%Y')
+        except (ValueError, OverflowError):
+            pass
+        
+        # Step 5: Log unparseable dates
+        logger.warning(f"Could not parse date: {date_str}")
+        return None
+        
+    except Exception as e:
+        logger.error(f"Error parsing date '{date_str}': {str(e)}")
+        return None
+
+class DataParser:
+    def __init__(self, data_folder, full_columns=True):
+        self.data_folder = Path(data_folder)
+        self.full_columns = full_columns
+        self.parsed_dates = {}
+        
+    def parse_date(self, date_str, formats_tried=False):
+        """Parse different date formats to dd-mm-yyyy, reusing results for repeated values."""
+        if date_str is None or date_str is pd.NaT:
             return None
-            
-        except Exception as e:
-            logger.error(f"Error parsing date '{date_str}': {str(e)}")
+        if isinstance(date_str, datetime):
+            return date_str.strftime('%d-%m-%Y')
+        
+        # Empty markers (including stringified NaN/NaT) skip the parser entirely
+        date_str = str(date_str).strip()
+        if date_str.lower() in _EMPTY:
+            return None
+        
+        today = datetime.now()
+        return _parse_date_cached(date_str, datetime(today.year, today.month, 1), formats_tried)
+
+    def _parse_series(self, series, preferred_formats=()):
+        """Parse a column of dates to datetime64 (day precision), trying each known format on the whole column.
+        
+        Formats the source system is known to export are tried first, so the
+        first pass usually parses the whole column.
+        """
+        values = series.fillna('').astype(str).str.strip()
+        parsed = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+        
+        # Numeric values: Excel serial dates, Unix timestamps in seconds or milliseconds
+        numeric = pd.to_numeric(values, errors='coerce')
+        excel = (numeric > 25569) & (numeric < 60000)
+        parsed[excel] = pd.Timestamp('1899-12-30') + pd.to_timedelta(numeric[excel], unit='D')
+        unix_seconds = (numeric >= 1e9) & (numeric < 1e12)
+        parsed[unix_seconds] = self._within_bounds(pd.to_datetime(numeric[unix_seconds], unit='s', errors='coerce'))
+        unix_millis = numeric >= 1e12
+        parsed[unix_millis] = self._within_bounds(pd.to_datetime(numeric[unix_millis], unit='ms', errors='coerce'))
+        
+        # Text values: try each known format on whatever is still unparsed
+        text = (values != '') & numeric.isna()
+        formats = list(preferred_formats) + [fmt for fmt in DATE_FORMATS if fmt not in preferred_formats]
+        for fmt in formats:
+            pending = parsed.isna() & text
+            if not pending.any():
+                break
+            parsed[pending] = self._within_bounds(pd.to_datetime(values[pending], format=fmt, errors='coerce'))
+        
+        # Fall back to parse_date for anything left, once per distinct value;
+        # every known format has already failed on these, so skip straight to dateutil
+        pending = parsed.isna() & text
+        if pending.any():
+            fallback = {value: self.parse_date(value, formats_tried=True) for value in values[pending].unique()}
+            parsed[pending] = self._within_bounds(
+                pd.to_datetime(values[pending].map(fallback), format='%d-%m-%Y', errors='coerce')
+            )
+        
+        return parsed.dt.normalize()
+
+    def _within_bounds(self, dates):
+        """Turn dates outside the datetime64[ns] range (e.g. 9999-12-31 placeholders) into NaT."""
+        return dates.where((dates >= pd.Timestamp.min) & (dates <= pd.Timestamp.max))
+
+    def _load_sheet(self, sheet_name, config):
+        """Load a single sheet and parse its dates, or return None if no file exists."""
+        xlsx_path = self.data_folder / f"{sheet_name}.xlsx"
+        csv_path = self.data_folder / f"{sheet_name}.csv"
+        
+        # Only load the columns the checks use, unless the full export is wanted
+        usecols = None
+        if not self.full_columns:
+            needed = set(config['email_cols'] + config['date_cols'] + config['status_cols'])
+            usecols = lambda col: col in needed
+        
+        if xlsx_path.exists():
+            logger.info(f"Processing Excel file: {xlsx_path}")
+            df = pd.read_excel(xlsx_path, engine=EXCEL_ENGINE, usecols=usecols, na_values=['', 'NA', 'N/A'])
+        elif csv_path.exists():
+            logger.info(f"Processing CSV file: {csv_path}")
+            df = pd.read_csv(csv_path, usecols=usecols, na_values=['', 'NA', 'N/A'])
+        else:
+            logger.warning(f"No file found for {sheet_name}")
             return None
+        
+        # Add source system column
+        df['Source System'] = sheet_name
+        
+        # Special handling for GWS status
+        if sheet_name == 'gws' and 'Status [READ ONLY]' in df.columns:
+            # Ensure status is properly formatted
+            df['Status [READ ONLY]'] = df['Status [READ ONLY]'].str.upper()
+        
+        # Parse dates
+        for date_col in config['date_cols']:
+            if date_col in df.columns:
+                logger.info(f"Parsing dates for column: {date_col} in {sheet_name}")
+                
+                raw = df[date_col]
+                df[date_col] = self._parse_series(raw, config['date_formats'])
+                
+                # Log any unparsed dates (excluding empty markers such as "Never logged in")
+                failed = df[date_col].isna() & raw.notna()
+                if failed.any():
+                    values = raw[failed].astype(str).str.strip()
+                    unparsed = values[~values.str.lower().isin(_EMPTY)].unique()
+                    if len(unparsed) > 0:
+                        logger.warning(f"Unparsed dates in {sheet_name}.{date_col}: {list(unparsed)}")
+        
+        # Reorder columns with Source System first
+        priority_cols = ['Source System'] + config['email_cols'] + config['date_cols'] + config['status_cols']
+        remaining_cols = [col for col in df.columns if col not in priority_cols]
+        df = df[priority_cols + remaining_cols]
+        
+        return df
 
     def load_and_parse(self):
         """Load all sheets and parse dates."""
@@ -133,112 +224,80 @@ class DataParser:
                 'darwinbox': {
                     'date_cols': ['Date Of Joining', 'Date Of Exit'],
                     'email_cols': ['Official Email ID'],
-                    'status_cols': ['Employee Type', 'Employment Status']
+                    'status_cols': ['Employee Type', 'Employment Status'],
+                    'date_formats': []
                 },
                 'gws': {
                     'date_cols': ['Last Sign In [READ ONLY]'],
                     'email_cols': ['Email Address [Required]'],
-                    'status_cols': ['Status [READ ONLY]']
+                    'status_cols': ['Status [READ ONLY]'],
+                    'date_formats': ['%Y/%m/%d %H:%M:%S']
                 },
                 'okta': {
                     'date_cols': ['user.lastUpdate', 'user.created', 'user.activation', 
                                 'user.statusChange', 'user.lastLogin'],
                     'email_cols': ['user.email', 'user.secondEmail'],
-                    'status_cols': ['user.status']
+                    'status_cols': ['user.status'],
+                    'date_formats': ['%Y-%m-%dT%H:%M:%S.%fZ']
                 },
                 'slack': {
                     'date_cols': ['Account created (UTC)', 'Last active (UTC)', 
                                 'Deactivated date (UTC)'],
                     'email_cols': ['Email'],
-                    'status_cols': ['Account type']
+                    'status_cols': ['Account type'],
+                    'date_formats': ['%Y-%m-%d %H:%M:%S']
                 }
             }
             
-            parsed_dfs = {}
+            # Worker processes only pay off once the inputs are large enough
+            # to outweigh their start-up cost; smaller inputs parse in process
+            input_bytes = sum(
+                path.stat().st_size
+                for sheet_name in sheets_config
+                for path in (self.data_folder / f"{sheet_name}.xlsx", self.data_folder / f"{sheet_name}.csv")
+                if path.exists()
+            )
+            workers = min(len(sheets_config), os.cpu_count() or 1)
+            if input_bytes >= PARALLEL_MIN_BYTES and workers > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(
+                        _parse_one_sheet,
+                        [self.data_folder] * len(sheets_config),
+                        [self.full_columns] * len(sheets_config),
+                        sheets_config.keys(),
+                        sheets_config.values()
+                    ))
+            else:
+                results = [
+                    (sheet_name, self._load_sheet(sheet_name, config))
+                    for sheet_name, config in sheets_config.items()
+                ]
             
-            # Process each sheet
-            for sheet_name, config in sheets_config.items():
-                xlsx_path = self.data_folder / f"{sheet_name}.xlsx"
-                csv_path = self.data_folder / f"{sheet_name}.csv"
-                
-                if xlsx_path.exists():
-                    logger.info(f"Processing Excel file: {xlsx_path}")
-                    df = pd.read_excel(xlsx_path, na_values=['', 'NA', 'N/A'])
-                elif csv_path.exists():
-                    logger.info(f"Processing CSV file: {csv_path}")
-                    df = pd.read_csv(csv_path, na_values=['', 'NA', 'N/A'])
-                else:
-                    logger.warning(f"No file found for {sheet_name}")
+            # Collect the sheets in the configured order
+            parsed_dfs = {}
+            for sheet_name, df in results:
+                if df is None:
                     continue
-                
-                # Add source system column
-                df['Source System'] = sheet_name
-                
-                # Special handling for GWS status
-                if sheet_name == 'gws' and 'Status [READ ONLY]' in df.columns:
-                    # Ensure status is properly formatted
-                    df['Status [READ ONLY]'] = df['Status [READ ONLY]'].str.upper()
-                
-                # Parse dates
-                for date_col in config['date_cols']:
+                for date_col in sheets_config[sheet_name]['date_cols']:
                     if date_col in df.columns:
-                        logger.info(f"Parsing dates for column: {date_col} in {sheet_name}")
-                        
-                        # Special handling for darwinbox Date Of Joining
-                        if sheet_name == 'darwinbox' and date_col == 'Date Of Joining':
-                            df[date_col] = df[date_col].fillna('')
-                            df[date_col] = df[date_col].astype(str)
-                            df[date_col] = df[date_col].apply(self.parse_date)
-                            # Skip the additional datetime conversion since parse_date already returns
-                            # the correct format
-                        else:
-                            # Original date parsing logic for other columns
-                            df[date_col] = df[date_col].fillna('')
-                            df[date_col] = df[date_col].astype(str)
-                            df[date_col] = df[date_col].apply(self.parse_date)
-                            df[date_col] = pd.to_datetime(df[date_col], format='%d-%m-%Y', errors='coerce')
-                            df[date_col] = df[date_col].dt.strftime('%d-%m-%Y')
-                        
                         self.parsed_dates[f"{sheet_name}_{date_col}"] = date_col
-                        
-                        # Log any unparsed dates (excluding empty and "Never logged in")
-                        unparsed = df[
-                            (df[date_col].isna()) & 
-                            (df[date_col].astype(str).str.strip() != '') & 
-                            (df[date_col].astype(str).str.lower() != 'never logged in')
-                        ][date_col].unique()
-                        if len(unparsed) > 0:
-                            logger.warning(f"Unparsed dates in {sheet_name}.{date_col}: {[x for x in unparsed if str(x).strip() != '']}")
-                
-                # Reorder columns with Source System first
-                priority_cols = ['Source System'] + config['email_cols'] + config['date_cols'] + config['status_cols']
-                remaining_cols = [col for col in df.columns if col not in priority_cols]
-                df = df[priority_cols + remaining_cols]
-                
                 parsed_dfs[sheet_name] = df
             
             # Save all parsed data to a single Excel file with multiple sheets
             output_path = self.data_folder / "parsed_data.xlsx"
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                for sheet_name, df in parsed_dfs.items():
-                    # Convert datetime columns to dd-mm-yyyy format before saving
-                    df_to_save = df.copy()
-                    for col in df_to_save.columns:
-                        if any(date_term in col.lower() for date_term in ['date', 'joining', 'exit', 'login']):
-                            # Skip conversion if the column is already in the correct format
-                            if df_to_save[col].dtype == 'object':
-                                # Check if values are already in dd-mm-yyyy format
-                                continue
-                            # For any other format, convert explicitly with dayfirst=True
-                            df_to_save[col] = pd.to_datetime(
-                                df_to_save[col], 
-                                format='%d-%m-%Y',
-                                errors='coerce',
-                                dayfirst=True
-                            ).dt.strftime('%d-%m-%Y')
-                    
-                    df_to_save.to_excel(writer, sheet_name=sheet_name, index=False)
-                    logger.info(f"Saved sheet {sheet_name} to parsed_data.xlsx")
+            workbook = openpyxl.Workbook(write_only=True)
+            for sheet_name, df in parsed_dfs.items():
+                # Write parsed dates in dd-mm-yyyy format and missing values as empty cells
+                date_cols = df.select_dtypes('datetime').columns
+                df = df.assign(**{col: df[col].dt.strftime('%d-%m-%Y') for col in date_cols}).astype(object)
+                df = df.where(df.notna(), None)
+                
+                worksheet = workbook.create_sheet(sheet_name)
+                worksheet.append(df.columns.tolist())
+                for values in df.itertuples(index=False, name=None):
+                    worksheet.append(values)
+                logger.info(f"Saved sheet {sheet_name} to parsed_data.xlsx")
+            workbook.save(output_path)
             
             logger.info(f"Saved all parsed data to {output_path}")
             
@@ -250,4 +309,9 @@ class DataParser:
 
     def get_parsed_date_columns(self):
         """Return information about parsed date columns."""
-        return self.parsed_dates
\ No newline at end of file
+        return self.parsed_dates
+
+
+def _parse_one_sheet(data_folder, full_columns, sheet_name, config):
+    """Load and parse one sheet; module level so it can run in a worker process."""
+    return sheet_name, DataParser(data_folder, full_columns)._load_sheet(sheet_name, config)
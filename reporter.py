@@ -6,6 +6,15 @@ from datetime import datetime
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Day zero of Excel's serial date numbers
+EXCEL_EPOCH = pd.Timestamp('1899-12-30')
+
+# Column name fragments that mark a date column
+DATE_TERMS = ('date', 'joining', 'exit', 'login')
+
+# Rows converted and written per batch in the detail sheets
+CHUNK_ROWS = 50_000
+
 class AccessReporter:
     def __init__(self, parsed_dfs, inspection_results):
         self.dfs = parsed_dfs
@@ -22,7 +31,11 @@ class AccessReporter:
             with pd.ExcelWriter(
                 output_path, 
                 engine='xlsxwriter',
-                engine_kwargs={'options': {'nan_inf_to_errors': True}}
+                engine_kwargs={'options': {
+                    'constant_memory': True,
+                    'nan_inf_to_errors': True,
+                    'default_date_format': 'dd-mm-yyyy'
+                }}
             ) as writer:
                 # Add date format
                 date_format = writer.book.add_format({'num_format': 'dd-mm-yyyy'})
@@ -39,14 +52,7 @@ class AccessReporter:
                     **{f'Parsed_{name}': data for name, data in self.dfs.items()}
                 }.items():
                     if df is not None:
-                        df = df.copy()
-                        df.fillna('').to_excel(writer, sheet_name=sheet_name, index=False)
-                        worksheet = writer.sheets[sheet_name]
-                        
-                        # Apply date format to date columns
-                        for idx, col in enumerate(df.columns):
-                            if any(date_term in col.lower() for date_term in ['date', 'joining', 'exit', 'login']):
-                                worksheet.set_column(idx, idx, None, date_format)
+                        self._write_sheet(writer, sheet_name, df, date_format)
             
             logger.info(f"Generated full report at {output_path}")
             return output_path
@@ -55,6 +61,34 @@ class AccessReporter:
             logger.error(f"Error generating full report: {str(e)}")
             raise
 
+    def _write_sheet(self, writer, sheet_name, df, date_format):
+        """Write a dataframe row by row, as required by constant_memory mode."""
+        worksheet = writer.book.add_worksheet(sheet_name)
+        
+        # Apply date format to date columns before any rows are flushed
+        datetime_cols = df.select_dtypes('datetime').columns
+        date_col_idx = {
+            idx for idx, col in enumerate(df.columns)
+            if col in datetime_cols or any(date_term in col.lower() for date_term in DATE_TERMS)
+        }
+        for idx in sorted(date_col_idx):
+            worksheet.set_column(idx, idx, None, date_format)
+        
+        worksheet.write_row(0, 0, df.columns.tolist())
+        
+        # Convert and write in chunks so large sheets never hold a full object copy
+        for start in range(0, len(df), CHUNK_ROWS):
+            chunk = df.iloc[start:start + CHUNK_ROWS]
+            
+            # Convert datetime columns to Excel serial numbers a whole column at a time;
+            # cells written without a format pick up the column's date format
+            chunk = chunk.assign(**{col: (chunk[col] - EXCEL_EPOCH) / pd.Timedelta(days=1) for col in datetime_cols})
+            
+            # Write missing values (including NaT) as blank cells
+            chunk = chunk.astype(object).where(chunk.notna(), '')
+            for row, values in enumerate(chunk.itertuples(index=False, name=None), start=start + 1):
+                worksheet.write_row(row, 0, values)
+
     def _write_summary_sheet(self, writer):
         """Write the main summary sheet in the format shown in screenshot."""
         workbook = writer.book
@@ -65,48 +99,33 @@ class AccessReporter:
         
         # Write HR Summary section
         worksheet.write('A1', 'HR Summary', bold)
-        worksheet.write('A2', 'Employee Type')
-        worksheet.write('B2', 'New Joiners')
-        worksheet.write('C2', 'Active Employees')
-        worksheet.write('D2', 'Terminated Users')
+        worksheet.write_row('A2', ['Employee Type', 'New Joiners', 'Active Employees', 'Terminated Users'])
         
         # Populate HR data
         row = 2
-        for idx, data in self.results['hr_summary'].iterrows():
-            worksheet.write(row, 0, data['Employee Type'])
-            worksheet.write(row, 1, data['New Joiners'])
-            worksheet.write(row, 2, data['Active Employees'])
-            worksheet.write(row, 3, data['Terminated Users'])
+        hr_columns = ['Employee Type', 'New Joiners', 'Active Employees', 'Terminated Users']
+        for values in self.results['hr_summary'][hr_columns].itertuples(index=False, name=None):
+            worksheet.write_row(row, 0, values)
             row += 1
         
         # Write IT Systems Summary section
         current_row = row + 2  # Add spacing
         worksheet.write(f'A{current_row}', 'IT Systems Summary', bold)
-        worksheet.write(f'A{current_row+1}', 'System')
-        worksheet.write(f'B{current_row+1}', 'Total Users')
-        worksheet.write(f'C{current_row+1}', 'Active Users')
-        worksheet.write(f'D{current_row+1}', 'Inactive Users')
+        worksheet.write_row(f'A{current_row+1}', ['System', 'Total Users', 'Active Users', 'Inactive Users'])
         
         # Populate IT Systems data
         current_row += 2
-        for idx, data in self.results['it_summary'].iterrows():
-            worksheet.write(current_row, 0, data['System'])
-            worksheet.write(current_row, 1, data['Total Users'])
-            worksheet.write(current_row, 2, data['Active Users'])
-            worksheet.write(current_row, 3, data['Inactive Users'])
+        it_columns = ['System', 'Total Users', 'Active Users', 'Inactive Users']
+        for values in self.results['it_summary'][it_columns].itertuples(index=False, name=None):
+            worksheet.write_row(current_row, 0, values)
             current_row += 1
         
         # Write Compliance Summary section
         current_row += 2  # Add spacing
         worksheet.write(f'A{current_row}', 'Compliance Summary', bold)
-        worksheet.write(f'A{current_row+1}', 'Check Type')
-        worksheet.write(f'B{current_row+1}', 'description')
-        worksheet.write(f'C{current_row+1}', 'Total Checked')
-        worksheet.write(f'D{current_row+1}', 'Non Compliant')
-        worksheet.write(f'E{current_row+1}', 'Compliance Rate')
-        worksheet.write(f'F{current_row+1}', 'Okta')
-        worksheet.write(f'G{current_row+1}', 'Slack')
-        worksheet.write(f'H{current_row+1}', 'GWS')
+        worksheet.write_row(f'A{current_row+1}', [
+            'Check Type', 'description', 'Total Checked', 'Non Compliant', 'Compliance Rate', 'Okta', 'Slack', 'GWS'
+        ])
         
         # Add descriptions
         descriptions = {
@@ -118,27 +137,17 @@ class AccessReporter:
         
         # Populate Compliance data with descriptions
         current_row += 2
-        compliance_data = self.results['compliance_summary']
-        for idx, data in compliance_data.iterrows():
-            check_type = data['Check Type']
-            worksheet.write(current_row, 0, check_type)
-            worksheet.write(current_row, 1, descriptions.get(check_type, ''))
-            worksheet.write(current_row, 2, data['Total Checked'])
+        compliance_data = self.results['compliance_summary'].reindex(columns=[
+            'Check Type', 'Total Checked', 'Non Compliant', 'Compliance Rate', 'Okta', 'Slack', 'GWS'
+        ])
+        for check_type, total, non_compliant, rate, okta, slack, gws in compliance_data.itertuples(index=False, name=None):
+            values = [check_type, descriptions.get(check_type, ''), total]
             
             if check_type in ['New Joiner Access', 'Leaver Access']:
-                if 'Non Compliant' in data:
-                    worksheet.write(current_row, 3, data['Non Compliant'])
-                if 'Compliance Rate' in data:
-                    worksheet.write(current_row, 4, data['Compliance Rate'])
-            
-            elif check_type == 'Idle Users':
-                worksheet.write(current_row, 5, data['Okta'])
-                worksheet.write(current_row, 6, data['Slack'])
-                worksheet.write(current_row, 7, data['GWS'])
+                values += [non_compliant, rate]
             
-            elif check_type == 'System Users':
-                worksheet.write(current_row, 5, data['Okta'])
-                worksheet.write(current_row, 6, data['Slack'])
-                worksheet.write(current_row, 7, data['GWS'])
+            elif check_type in ['Idle Users', 'System Users']:
+                values += [None, None, okta, slack, gws]
             
+            worksheet.write_row(current_row, 0, values)
             current_row += 1
\ No newline at end of file